@@ -5,48 +5,102 @@ translates them from German to English, and sends a Telegram notification.
 """
 
 import argparse
+import hashlib
 import html
 import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, FeatureNotFound, Tag
 from deep_translator import GoogleTranslator
 from deep_translator.exceptions import (
     RequestError,
     TooManyRequests,
     TranslationNotFound,
 )
+import soupsieve as sv
+from urllib3.util.retry import Retry
 
 try:
-    from dotenv import load_dotenv
-except ImportError:  # pragma: no cover - optional dependency for local testing
-    load_dotenv = None
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    etree = None
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
-if load_dotenv:
+
+def _maybe_load_env() -> None:
+    """Load credentials from a local ``.env`` file when they are not yet set.
+
+    Deployments (GitHub Actions, systemd) already export the Telegram
+    settings, so the optional ``dotenv`` import and file lookup are skipped.
+    """
+    if os.environ.get("TELEGRAM_BOT_TOKEN") and os.environ.get("TELEGRAM_CHAT_ID"):
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover - optional dependency for local testing
+        return
     load_dotenv()
 
+
+_maybe_load_env()
+
 NEWS_URL = (
     "https://www.alpine-adventure.at/de/alpine-adventure/alpine-adventure/news.html"
 )
 LAST_SEEN_FILE = Path(__file__).parent / "data" / "last_seen.json"
+TRANSLATION_CACHE_FILE = LAST_SEEN_FILE.parent / "translation_cache.json"
+TRANSLATION_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+TRANSLATION_WORKERS = 4  # concurrent translation requests for long text
 
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "")
 
 TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
 
+# Built once: every part of a multi-part notification reuses them.
+_SEND_URL = (
+    TELEGRAM_API_URL.format(token=TELEGRAM_BOT_TOKEN) if TELEGRAM_BOT_TOKEN else None
+)
+_PAYLOAD_BASE = {
+    "chat_id": TELEGRAM_CHAT_ID,
+    "parse_mode": "HTML",
+    "disable_web_page_preview": False,
+}
+
 REQUEST_TIMEOUT = 30  # seconds
+DOWNLOAD_CHUNK_SIZE = 8192  # bytes
+
+# Shared HTTP session: keeps TCP/TLS connections alive across the page fetch
+# and multi-part Telegram sends, and retries transient server errors.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "pitztal-monitor/1.0"})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -59,20 +113,55 @@ logger = logging.getLogger(__name__)
 # Scraping
 # ---------------------------------------------------------------------------
 
+_HEADER_ICON_RE = re.compile(r"\b(?:keyboard_arrow_right|terrain)\b")
+_WS_RE = re.compile(r"\s+")
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})")
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"[a-z]+")
+
+# CSS selectors are compiled once at import time and reused on every run.
+
+# Headings that may introduce the news accordion. Whether a heading is the
+# "Ice News" one is decided by _is_ice_news_heading, in any letter case; the
+# streaming reader uses the same check.
+_ICE_NEWS_LABEL = "ice news"
+_HEADING_SEL = sv.compile("h2, h3")
+
+# Fallback news containers, in order of preference.
+_FALLBACK_SELECTORS = (
+    "article.news-item",
+    "article",
+    ".news-list-item",
+    ".news-item",
+    ".teaser",
+)
+_FALLBACK_SEL = sv.compile(", ".join(_FALLBACK_SELECTORS))
+_FALLBACK_MATCHERS = tuple(sv.compile(selector) for selector in _FALLBACK_SELECTORS)
+
+# Fallback lookups for article titles/teasers by (case-insensitive) class name.
+_TITLE_SEL = sv.compile('[class*="title" i]')
+_TEASER_SEL = sv.compile('[class*="teaser" i], [class*="summary" i]')
+
+# HTTP cache validators stored in last_seen.json, mapped to the response
+# header they are read from and the conditional request header they feed.
+_CACHE_VALIDATORS = {
+    "etag": ("ETag", "If-None-Match"),
+    "last_modified": ("Last-Modified", "If-Modified-Since"),
+}
+
 
 def _clean_header_text(text: str) -> str:
     """Normalize accordion header text by removing icon labels."""
     if not text:
         return ""
-    cleaned = re.sub(r"\b(keyboard_arrow_right|terrain)\b", "", text)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    return _WS_RE.sub(" ", _HEADER_ICON_RE.sub("", text)).strip()
 
 
 def _extract_date_from_title(title: str) -> date | None:
     """Parse a date from a header like 'Ice News 22.02.2026'."""
     if not title:
         return None
-    match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{2,4})", title)
+    match = _DATE_RE.search(title)
     if not match:
         return None
     day, month, year = (int(part) for part in match.groups())
@@ -84,15 +173,62 @@ def _extract_date_from_title(title: str) -> date | None:
         return None
 
 
+def _parse_html(markup: bytes, encoding: str | None = None) -> BeautifulSoup:
+    """Parse *markup* with the lxml parser, falling back to ``html.parser``."""
+    try:
+        return BeautifulSoup(markup, "lxml", from_encoding=encoding)
+    except FeatureNotFound:  # pragma: no cover - lxml is a declared dependency
+        return BeautifulSoup(markup, "html.parser", from_encoding=encoding)
+
+
+def _is_ice_news_heading(text: str) -> bool:
+    """Return True if heading *text* starts with "Ice News" (any case)."""
+    return _WS_RE.sub(" ", text).strip().lower().startswith(_ICE_NEWS_LABEL)
+
+
+def _read_news_markup(response: requests.Response) -> bytes:
+    """Download the page body, stopping once the "Ice News" list is complete.
+
+    The body is fed to an incremental parser as it arrives. As soon as the
+    first ``ul.collapsible`` following an "Ice News" heading has been closed,
+    the rest of the page (other sections, footer, scripts) is not downloaded.
+    Without lxml the whole body is read.
+    """
+    if etree is None:  # pragma: no cover - lxml is a declared dependency
+        return response.content
+
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    received: list[bytes] = []
+    heading_seen = False
+    accordion = None
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        received.append(chunk)
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "end" and element is accordion:
+                return b"".join(received)
+            if not heading_seen:
+                if event == "end" and element.tag in ("h2", "h3"):
+                    heading_seen = _is_ice_news_heading(" ".join(element.itertext()))
+            elif (
+                accordion is None
+                and event == "start"
+                and element.tag == "ul"
+                and "collapsible" in (element.get("class") or "").split()
+            ):
+                accordion = element
+    return b"".join(received)
+
+
 def _extract_collapsible_items(root: Tag, base_url: str) -> list[dict]:
     """Extract items from the first accordion-style news list."""
     accordion = None
-    for heading in root.find_all(["h2", "h3"]):
-        heading_text = heading.get_text(" ", strip=True)
-        if heading_text.lower().startswith("ice news"):
-            accordion = heading.find_next("ul", class_="collapsible")
-            if accordion:
-                break
+    for heading in _HEADING_SEL.select(root):
+        if not _is_ice_news_heading(heading.get_text(" ", strip=True)):
+            continue
+        accordion = heading.find_next("ul", class_="collapsible")
+        if accordion:
+            break
 
     if not accordion:
         accordion = root.find("ul", class_="collapsible")
@@ -100,10 +236,16 @@ def _extract_collapsible_items(root: Tag, base_url: str) -> list[dict]:
     if not accordion:
         return []
 
-    items = []
+    dated_items: list[tuple[date, dict]] = []
     for entry in accordion.find_all("li", recursive=False):
-        header = entry.select_one(".collapsible-header")
-        body = entry.select_one(".collapsible-body")
+        header: Tag | None = None
+        body: Tag | None = None
+        for child in entry.find_all(True, recursive=False):
+            classes = child.get("class") or ()
+            if header is None and "collapsible-header" in classes:
+                header = child
+            elif body is None and "collapsible-body" in classes:
+                body = child
 
         title = _clean_header_text(header.get_text(" ", strip=True)) if header else ""
         paragraphs = []
@@ -114,28 +256,78 @@ def _extract_collapsible_items(root: Tag, base_url: str) -> list[dict]:
                     paragraphs.append(text)
         snippet = "\n\n".join(paragraphs).strip()
 
-        item_date = _extract_date_from_title(title)
-        item = {"title": title, "snippet": snippet, "link": base_url, "date": item_date}
-        if item["title"] or item["snippet"]:
-            items.append(item)
-
-    items.sort(key=lambda item: item.get("date") or date.min, reverse=True)
-    for item in items:
-        item.pop("date", None)
-    return items
+        if title or snippet:
+            item_date = _extract_date_from_title(title) or date.min
+            dated_items.append(
+                (
+                    item_date,
+                    {
+                        "title": title,
+                        "snippet": snippet,
+                        "paragraphs": paragraphs,
+                        "link": base_url,
+                    },
+                )
+            )
+
+    # Stable sort: entries with the same (or no) date keep their page order.
+    dated_items.sort(key=lambda pair: pair[0], reverse=True)
+    return [item for _, item in dated_items]
+
+
+def _select_fallback_candidates(soup: BeautifulSoup) -> list[Tag]:
+    """Return the nodes matched by the most preferred fallback selector.
+
+    All fallback selectors are matched in a single pass over the tree, then
+    the matches are filtered selector by selector in order of preference.
+    """
+    nodes = _FALLBACK_SEL.select(soup)
+    for matcher in _FALLBACK_MATCHERS:
+        matched = [node for node in nodes if matcher.match(node)]
+        if matched:
+            return matched
+    return []
 
 
-def fetch_news(url: str = NEWS_URL) -> list[dict]:
+def fetch_news(
+    url: str = NEWS_URL, validators: dict[str, str] | None = None
+) -> list[dict] | None:
     """Fetch and parse news items from the Alpine Adventure news page.
 
-    Returns a list of dicts with keys: title, snippet, link.
+    Returns a list of dicts with keys: title, snippet, link (accordion items
+    also carry their snippet as a ``paragraphs`` list).
     The list is ordered newest-first as they appear on the page.
+
+    If *validators* holds an ``etag`` and/or ``last_modified`` value from a
+    previous response, the page is requested conditionally and ``None`` is
+    returned when the server answers 304 Not Modified. Otherwise the dict is
+    updated in place with the validators of the new response.
     """
     logger.info("Fetching news from %s", url)
-    response = requests.get(url, timeout=REQUEST_TIMEOUT)
-    response.raise_for_status()
+    headers = {}
+    for key, (_, request_header) in _CACHE_VALIDATORS.items():
+        if validators and validators.get(key):
+            headers[request_header] = validators[key]
+    response = SESSION.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
+    try:
+        if response.status_code == 304:
+            logger.info("News page not modified since the last check.")
+            return None
+        response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+        if validators is not None:
+            for key, (response_header, _) in _CACHE_VALIDATORS.items():
+                value = response.headers.get(response_header)
+                if value:
+                    validators[key] = value
+                else:
+                    validators.pop(key, None)
+
+        markup = _read_news_markup(response)
+    finally:
+        response.close()
+
+    soup = _parse_html(markup, response.encoding)
 
     root: Tag = soup
     collapsible_items = _extract_collapsible_items(root, url)
@@ -146,23 +338,15 @@ def fetch_news(url: str = NEWS_URL) -> list[dict]:
 
     # The page uses <article> elements or generic news-list containers.
     # We try several common selectors in order of preference.
-    candidates = (
-        soup.select("article.news-item")
-        or soup.select("article")
-        or soup.select(".news-list-item")
-        or soup.select(".news-item")
-        or soup.select(".teaser")
-    )
+    candidates = _select_fallback_candidates(soup)
 
     for article in candidates:
-        title_tag = article.find(["h1", "h2", "h3", "h4"]) or article.find(
-            class_=lambda c: c and "title" in c.lower()
+        title_tag = article.find(["h1", "h2", "h3", "h4"]) or _TITLE_SEL.select_one(
+            article
         )
         title = title_tag.get_text(strip=True) if title_tag else ""
 
-        snippet_tag = article.find("p") or article.find(
-            class_=lambda c: c and ("teaser" in c.lower() or "summary" in c.lower())
-        )
+        snippet_tag = article.find("p") or _TEASER_SEL.select_one(article)
         snippet = snippet_tag.get_text(strip=True) if snippet_tag else ""
 
         link_tag = article.find("a", href=True)
@@ -184,30 +368,94 @@ def fetch_news(url: str = NEWS_URL) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+def _json_dumps(data: dict) -> bytes:
+    """Encode *data* as indented UTF-8 JSON with a trailing newline."""
+    return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+# Parsed last_seen.json, keyed by (path, mtime, size) so a long-lived process
+# only re-reads the file after it has changed.
+_last_seen_cache: tuple[tuple[str, int, int], dict] | None = None
+
+
 def load_last_seen() -> dict:
-    """Load the last-seen news item from disk."""
-    if LAST_SEEN_FILE.exists():
-        try:
-            with LAST_SEEN_FILE.open("r", encoding="utf-8") as fh:
-                return json.load(fh)
-        except (json.JSONDecodeError, OSError) as exc:
-            logger.warning("Could not read %s: %s", LAST_SEEN_FILE, exc)
-    return {}
+    """Load the last-seen news item from disk.
+
+    The parsed file is kept in memory and reused until the file's
+    modification time or size changes. A copy is returned, so callers may
+    modify it freely.
+    """
+    global _last_seen_cache
+    try:
+        st = LAST_SEEN_FILE.stat()
+    except FileNotFoundError:
+        return {}
+    except OSError as exc:
+        logger.warning("Could not read %s: %s", LAST_SEEN_FILE, exc)
+        return {}
+
+    key = (str(LAST_SEEN_FILE), st.st_mtime_ns, st.st_size)
+    if _last_seen_cache is not None and _last_seen_cache[0] == key:
+        return dict(_last_seen_cache[1])
+
+    try:
+        data = json.loads(LAST_SEEN_FILE.read_bytes())
+    except (ValueError, OSError) as exc:
+        logger.warning("Could not read %s: %s", LAST_SEEN_FILE, exc)
+        return {}
+    _last_seen_cache = (key, data)
+    return dict(data)
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write *data* as JSON to *path* without ever leaving a truncated file.
+
+    The JSON goes to a temporary sibling file, which is flushed to disk and
+    then moved over *path* with ``os.replace``.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            fh.write(_json_dumps(data))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def save_last_seen(item: dict) -> None:
     """Persist the most-recently-seen news item to disk."""
-    LAST_SEEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with LAST_SEEN_FILE.open("w", encoding="utf-8") as fh:
-        json.dump(item, fh, ensure_ascii=False, indent=2)
+    global _last_seen_cache
+    _last_seen_cache = None
+    _write_json_atomic(LAST_SEEN_FILE, item)
     logger.info("Saved last-seen item to %s", LAST_SEEN_FILE)
 
 
+def _content_hash(item: dict) -> str:
+    """Return a SHA-256 of *item*'s title and snippet, whitespace-normalized."""
+    content = f"{item.get('title') or ''}\x00{item.get('snippet') or ''}"
+    normalized = _WS_RE.sub(" ", content).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def is_new(item: dict, last_seen: dict) -> bool:
-    """Return True when *item* differs from the stored *last_seen* entry."""
-    return (item.get("title") != last_seen.get("title")) or (
-        item.get("snippet") != last_seen.get("snippet")
-    )
+    """Return True when *item* differs from the stored *last_seen* entry.
+
+    Items are compared by their content hash, so changes in whitespace alone
+    do not count as a new update. Entries stored without a ``hash`` are
+    hashed from their title and snippet.
+    """
+    # Fast path for the common unchanged case: identical fields, no hashing.
+    if (item.get("title"), item.get("snippet")) == (
+        last_seen.get("title"),
+        last_seen.get("snippet"),
+    ):
+        return False
+    stored_hash = last_seen.get("hash") or _content_hash(last_seen)
+    return _content_hash(item) != stored_hash
 
 
 # ---------------------------------------------------------------------------
@@ -215,16 +463,167 @@ def is_new(item: dict, last_seen: dict) -> bool:
 # ---------------------------------------------------------------------------
 
 
+_translator_local = threading.local()
+
+# Long-lived worker threads for concurrent translation. Keeping the threads
+# alive keeps their translators alive, so instances are reused across calls.
+_translation_executor = ThreadPoolExecutor(
+    max_workers=TRANSLATION_WORKERS, thread_name_prefix="translate"
+)
+
+_translation_cache: dict[str, dict] | None = None
+_translation_cache_dirty = False
+_translation_cache_lock = threading.Lock()
+
+
+def _get_translator() -> GoogleTranslator:
+    """Return this thread's German-to-English translator, creating it on first use.
+
+    GoogleTranslator keeps per-request state on the instance, so each thread
+    translating concurrently gets its own.
+    """
+    translator = getattr(_translator_local, "translator", None)
+    if translator is None:
+        translator = GoogleTranslator(source="de", target="en")
+        _translator_local.translator = translator
+    return translator
+
+
+def _translation_cache_key(text: str) -> str:
+    """Return the cache key for *text* (SHA-256 of the source text)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _load_translation_cache() -> dict[str, dict]:
+    """Return the translation cache, reading it from disk on first use.
+
+    Entries older than ``TRANSLATION_CACHE_TTL`` are dropped while loading.
+    """
+    global _translation_cache
+    with _translation_cache_lock:
+        if _translation_cache is not None:
+            return _translation_cache
+        entries: dict = {}
+        if TRANSLATION_CACHE_FILE.exists():
+            try:
+                entries = json.loads(TRANSLATION_CACHE_FILE.read_bytes())
+            except (ValueError, OSError) as exc:
+                logger.warning("Could not read %s: %s", TRANSLATION_CACHE_FILE, exc)
+        if not isinstance(entries, dict):
+            entries = {}
+        cutoff = time.time() - TRANSLATION_CACHE_TTL
+        _translation_cache = {
+            key: entry
+            for key, entry in entries.items()
+            if _is_valid_cache_entry(entry, cutoff)
+        }
+        return _translation_cache
+
+
+def _is_valid_cache_entry(entry: object, cutoff: float) -> bool:
+    """Return True if *entry* is a well-formed cache entry newer than *cutoff*.
+
+    The cache file may be stale or hand-edited, so malformed entries are
+    dropped instead of failing later on lookup.
+    """
+    if not isinstance(entry, dict) or not isinstance(entry.get("translated"), str):
+        return False
+    ts = entry.get("ts")
+    if isinstance(ts, bool) or not isinstance(ts, (int, float)):
+        return False
+    return ts >= cutoff
+
+
+def save_translation_cache() -> None:
+    """Persist new translations to disk, if any were added since the last save.
+
+    New translations are only recorded in memory, so the file is written
+    once per run instead of once per translated chunk.
+    """
+    global _translation_cache_dirty
+    with _translation_cache_lock:
+        if _translation_cache is None or not _translation_cache_dirty:
+            return
+        try:
+            _write_json_atomic(TRANSLATION_CACHE_FILE, _translation_cache)
+        except OSError as exc:
+            logger.warning("Could not write %s: %s", TRANSLATION_CACHE_FILE, exc)
+            return
+        _translation_cache_dirty = False
+
+
+# Common English function words that rarely appear as standalone German words,
+# and German function words that rule a text out as English. A text only
+# counts as English if enough of its words are English stopwords and none is
+# a German one, so German with an English loan phrase is still translated.
+_ENGLISH_STOPWORDS = frozenset(
+    {"the", "and", "is", "are", "of", "to", "with", "for", "on", "at", "this"}
+)
+_GERMAN_STOPWORDS = frozenset(
+    {
+        "der",
+        "die",
+        "das",
+        "den",
+        "dem",
+        "des",
+        "und",
+        "ist",
+        "sind",
+        "nicht",
+        "mit",
+        "ein",
+        "eine",
+        "auf",
+        "von",
+        "zu",
+        "im",
+        "fuer",
+        "bei",
+        "wir",
+    }
+)
+_ENGLISH_ASCII_RATIO = 0.98
+_ENGLISH_STOPWORD_SHARE = 0.15
+
+
+def _looks_english(text: str) -> bool:
+    """Return True if *text* is (almost) pure ASCII and reads as English.
+
+    A cheap heuristic that lets text already in English skip the round trip
+    to the translation service.
+    """
+    ascii_chars = sum(ch < "\x80" for ch in text)
+    if ascii_chars / len(text) <= _ENGLISH_ASCII_RATIO:
+        return False
+    words = _WORD_RE.findall(text.lower())
+    if not words or not _GERMAN_STOPWORDS.isdisjoint(words):
+        return False
+    english = sum(word in _ENGLISH_STOPWORDS for word in words)
+    return english / len(words) >= _ENGLISH_STOPWORD_SHARE
+
+
 def translate_to_english(text: str) -> str:
     """Translate *text* from German to English using Google Translate.
 
-    Falls back to the original text if translation fails.
+    Successful translations are cached (keyed by a hash of the source text)
+    and persisted by save_translation_cache(), so text that was already
+    translated is not sent again. Text that already looks English is
+    returned unchanged without a request. Falls back to the original text if
+    translation fails.
     """
-    if not text:
+    global _translation_cache_dirty
+    if not text or _looks_english(text):
         return text
+
+    cache = _load_translation_cache()
+    key = _translation_cache_key(text)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry["translated"]
+
     try:
-        translated = GoogleTranslator(source="de", target="en").translate(text)
-        return translated or text
+        translated = _get_translator().translate(text)
     except TranslationNotFound:
         logger.warning("Translation not found for text: %.80s", text)
         return text
@@ -238,28 +637,40 @@ def translate_to_english(text: str) -> str:
         logger.warning("Translation failed unexpectedly: %s", exc)
         return text
 
+    if not translated:
+        return text
+
+    with _translation_cache_lock:
+        cache[key] = {"translated": translated, "ts": int(time.time())}
+        _translation_cache_dirty = True
+    return translated
+
 
-def translate_long_text(text: str, max_chunk_size: int = 4500) -> str:
+def translate_long_text(text: str | list[str], max_chunk_size: int = 4500) -> str:
     """Translate long text by splitting into chunks to avoid length limits.
 
-    Splits text by paragraphs and translates each chunk separately.
+    *text* is either a string, split on blank lines, or a list of paragraphs
+    (as carried by scraped items). Paragraphs are packed into chunks that are
+    translated concurrently and joined back in their original order.
     """
     if not text:
-        return text
+        return ""
 
-    if len(text) <= max_chunk_size:
-        return translate_to_english(text)
+    if isinstance(text, str):
+        if len(text) <= max_chunk_size:
+            return translate_to_english(text)
+        paragraphs = text.split("\n\n")
+    else:
+        paragraphs = text
 
-    paragraphs = text.split("\n\n")
-    translated: list[str] = []
+    chunks: list[str] = []
     current_chunk: list[str] = []
     current_size = 0
 
     for para in paragraphs:
         para_size = len(para)
         if current_size + para_size > max_chunk_size and current_chunk:
-            chunk_text = "\n\n".join(current_chunk)
-            translated.append(translate_to_english(chunk_text))
+            chunks.append("\n\n".join(current_chunk))
             current_chunk = [para]
             current_size = para_size
         else:
@@ -267,10 +678,12 @@ def translate_long_text(text: str, max_chunk_size: int = 4500) -> str:
             current_size += para_size + 2
 
     if current_chunk:
-        chunk_text = "\n\n".join(current_chunk)
-        translated.append(translate_to_english(chunk_text))
+        chunks.append("\n\n".join(current_chunk))
 
-    return "\n\n".join(translated)
+    if len(chunks) == 1:
+        return translate_to_english(chunks[0])
+
+    return "\n\n".join(_translation_executor.map(translate_to_english, chunks))
 
 
 # ---------------------------------------------------------------------------
@@ -287,21 +700,15 @@ def send_telegram_message(message: str) -> None:
     Raises:
         requests.HTTPError: If the Telegram API returns an error.
     """
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+    if _SEND_URL is None or not _PAYLOAD_BASE["chat_id"]:
         logger.error(
             "TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID is not set. "
             "Skipping Telegram notification."
         )
         return
 
-    url = TELEGRAM_API_URL.format(token=TELEGRAM_BOT_TOKEN)
-    payload = {
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": message,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": False,
-    }
-    response = requests.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+    payload = {**_PAYLOAD_BASE, "text": message}
+    response = SESSION.post(_SEND_URL, json=payload, timeout=REQUEST_TIMEOUT)
     try:
         response.raise_for_status()
     except requests.HTTPError:
@@ -310,35 +717,39 @@ def send_telegram_message(message: str) -> None:
 
 
 def _split_message_into_chunks(
-    message: str, title: str, max_length: int = 4000
+    message: str, escaped_title: str, max_length: int = 4000
 ) -> list[str]:
     """Split a message into Telegram-sized chunks with headers.
 
-    Each chunk after the first will be prefixed with "TITLE - part N".
+    Each chunk after the first will be prefixed with "TITLE - part N", where
+    *escaped_title* is the already HTML-escaped title.
     """
     if len(message) <= max_length:
         return [message]
 
-    chunks: list[str] = []
-    lines = message.split("\n")
-    current_chunk: list[str] = []
-    current_length = 0
-
-    for line in lines:
-        line_length = len(line) + 1
-        if current_length + line_length > max_length and current_chunk:
-            chunks.append("\n".join(current_chunk))
-            current_chunk = [line]
-            current_length = line_length
-        else:
-            current_chunk.append(line)
-            current_length += line_length
+    # Offsets just past each line break, plus a virtual one past the end, so
+    # that every chunk ends at a line boundary and is sliced out directly.
+    boundaries: list[int] = []
+    pos = message.find("\n")
+    while pos != -1:
+        boundaries.append(pos + 1)
+        pos = message.find("\n", pos + 1)
+    end = len(message) + 1
+    boundaries.append(end)
 
-    if current_chunk:
-        chunks.append("\n".join(current_chunk))
+    chunks: list[str] = []
+    start = 0
+    while start < end:
+        index = bisect_right(boundaries, start + max_length) - 1
+        if index < 0 or boundaries[index] <= start:
+            # A single line longer than max_length becomes its own chunk.
+            index = bisect_right(boundaries, start)
+        cut = boundaries[index]
+        chunks.append(message[start : cut - 1])
+        start = cut
 
     for i in range(1, len(chunks)):
-        header = f"<b>{html.escape(title)} - part {i + 1}</b>\n\n"
+        header = f"<b>{escaped_title} - part {i + 1}</b>\n\n"
         chunks[i] = header + chunks[i]
 
     return chunks
@@ -347,15 +758,13 @@ def _split_message_into_chunks(
 def send_telegram_messages(item: dict, message: str) -> None:
     """Send message to Telegram, splitting into multiple messages if needed."""
     title = item.get("title", "News Update")
-    chunks = _split_message_into_chunks(message, title)
+    chunks = _split_message_into_chunks(message, html.escape(title))
 
-    for i, chunk in enumerate(chunks):
+    # Each part is sent only after the previous request has completed, which
+    # already keeps the parts in order; the pooled session reuses the same
+    # connection, so no extra delay between parts is needed.
+    for chunk in chunks:
         send_telegram_message(chunk)
-        if i < len(chunks) - 1:
-            # Small delay between messages to maintain order
-            import time
-
-            time.sleep(0.5)
 
     if len(chunks) > 1:
         logger.info("Telegram notification sent successfully (%d parts).", len(chunks))
@@ -363,6 +772,14 @@ def send_telegram_messages(item: dict, message: str) -> None:
         logger.info("Telegram notification sent successfully.")
 
 
+# Telegram message layout; each optional block carries its own trailing
+# blank line.
+_MESSAGE_TEMPLATE = "🏔 <b>Pitztal Ice – New Update!</b>\n\n{title}{snippet}{link}"
+_TITLE_TEMPLATE = "<b>{title}</b>\n{original}\n"
+_ORIGINAL_TEMPLATE = "<i>(Original: {title})</i>\n"
+_LINK_TEMPLATE = '<a href="{link}">Read more</a>'
+
+
 def build_message(item: dict) -> str:
     """Format a Telegram notification message for a news item.
 
@@ -370,7 +787,8 @@ def build_message(item: dict) -> str:
     the message with icons, bold text, and a link.
 
     Args:
-        item: Dictionary with keys 'title', 'snippet', and 'link'.
+        item: Dictionary with keys 'title', 'snippet', and 'link', and
+            optionally 'paragraphs' (the snippet split into paragraphs).
 
     Returns:
         HTML-formatted notification message string.
@@ -379,31 +797,36 @@ def build_message(item: dict) -> str:
     snippet_de = item.get("snippet", "")
     link = item.get("link", "")
 
-    title_en = translate_to_english(title_de)
-    snippet_en = translate_long_text(snippet_de)
+    # The two translations are independent requests, so run them side by side.
+    # The snippet is translated in this thread: translate_long_text hands its
+    # chunks to the same pool and must not wait on it from a pool worker.
+    title_future = _translation_executor.submit(translate_to_english, title_de)
+    snippet_en = translate_long_text(item.get("paragraphs") or snippet_de)
+    title_en = title_future.result()
 
-    title_de_safe = html.escape(title_de)
-    title_en_safe = html.escape(title_en)
-    snippet_en_safe = html.escape(snippet_en)
+    title_de_safe = html.escape(title_de) if title_de else ""
+    title_en_safe = html.escape(title_en) if title_en else ""
+    snippet_en_safe = html.escape(snippet_en) if snippet_en else ""
 
-    lines = ["🏔 <b>Pitztal Ice – New Update!</b>", ""]
+    title_block = ""
     if title_en_safe:
-        lines.append(f"<b>{title_en_safe}</b>")
+        original = ""
         if title_de_safe and title_de_safe != title_en_safe:
-            lines.append(f"<i>(Original: {title_de_safe})</i>")
-        lines.append("")
-    if snippet_en_safe:
-        lines.append(snippet_en_safe)
-        lines.append("")
-    if link:
-        lines.append(f'<a href="{link}">Read more</a>')
+            original = _ORIGINAL_TEMPLATE.format(title=title_de_safe)
+        title_block = _TITLE_TEMPLATE.format(title=title_en_safe, original=original)
 
-    return "\n".join(lines).strip()
+    return _MESSAGE_TEMPLATE.format_map(
+        {
+            "title": title_block,
+            "snippet": f"{snippet_en_safe}\n\n" if snippet_en_safe else "",
+            "link": _LINK_TEMPLATE.format(link=link) if link else "",
+        }
+    ).strip()
 
 
 def _strip_html(text: str) -> str:
     """Remove HTML tags for plain-text terminal output."""
-    return re.sub(r"<[^>]+>", "", text)
+    return _TAG_RE.sub("", text)
 
 
 def print_preview(message: str) -> None:
@@ -419,6 +842,18 @@ def print_preview(message: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _last_seen_record(item: dict, validators: dict[str, str]) -> dict:
+    """Build the last_seen.json entry for *item* with its hash and *validators*."""
+    record = {
+        key: value
+        for key, value in item.items()
+        if key != "paragraphs" and key not in _CACHE_VALIDATORS
+    }
+    record["hash"] = _content_hash(item)
+    record.update(validators)
+    return record
+
+
 def main(preview: bool = True, telegram: bool = True) -> None:
     """Fetch news, detect changes, and send notifications.
 
@@ -426,26 +861,37 @@ def main(preview: bool = True, telegram: bool = True) -> None:
         preview: If True, print translated preview to terminal.
         telegram: If True, send notification via Telegram.
     """
-    items = fetch_news()
+    last_seen = load_last_seen()
+    stored_validators = {
+        key: last_seen[key] for key in _CACHE_VALIDATORS if key in last_seen
+    }
+    validators = dict(stored_validators)
+
+    items = fetch_news(validators=validators)
+    if items is None:
+        logger.info("Latest news already pulled. No new updates available.")
+        return
     if not items:
         logger.info("No news items retrieved. Nothing to do.")
         return
 
     latest = items[0]
-    last_seen = load_last_seen()
 
     if not is_new(latest, last_seen):
         logger.info("Latest news already pulled. No new updates available.")
+        if validators != stored_validators:
+            save_last_seen(_last_seen_record(last_seen, validators))
         return
 
     logger.info("New update detected!")
     message = build_message(latest)
+    save_translation_cache()
     if preview:
         print_preview(message)
     if telegram:
         send_telegram_messages(latest, message)
 
-    save_last_seen(latest)
+    save_last_seen(_last_seen_record(latest, validators))
 
 
 def _parse_args() -> argparse.Namespace:
@@ -487,7 +933,8 @@ def _parse_args() -> argparse.Namespace:
 if __name__ == "__main__":
     try:
         args = _parse_args()
-        main(preview=args.preview, telegram=args.telegram)
+        with SESSION:
+            main(preview=args.preview, telegram=args.telegram)
     except requests.HTTPError as exc:
         logger.error("HTTP error: %s", exc)
         sys.exit(1)
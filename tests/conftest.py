@@ -0,0 +1,29 @@
+"""Shared pytest fixtures."""
+
+import threading
+
+import pytest
+
+import monitor_news
+
+
+@pytest.fixture(autouse=True)
+def _isolated_translation_cache(tmp_path, monkeypatch):
+    """Point the translation cache at a fresh file for every test."""
+    monkeypatch.setattr(
+        monitor_news, "TRANSLATION_CACHE_FILE", tmp_path / "translation_cache.json"
+    )
+    monkeypatch.setattr(monitor_news, "_translation_cache", None)
+    monkeypatch.setattr(monitor_news, "_translation_cache_dirty", False)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_translator(monkeypatch):
+    """Drop cached translators so each test builds one from its own patch."""
+    monkeypatch.setattr(monitor_news, "_translator_local", threading.local())
+
+
+@pytest.fixture(autouse=True)
+def _fresh_last_seen_cache(monkeypatch):
+    """Start every test without a parsed last_seen.json in memory."""
+    monkeypatch.setattr(monitor_news, "_last_seen_cache", None)
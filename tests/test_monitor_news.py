@@ -5,12 +5,35 @@ tests run fully offline without real credentials.
 """
 
 import json
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
 
 import monitor_news
 
 
+# ---------------------------------------------------------------------------
+# _maybe_load_env
+# ---------------------------------------------------------------------------
+
+
+def test_maybe_load_env_skips_dotenv_when_configured(monkeypatch):
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+    monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+    with patch("dotenv.load_dotenv") as mock_load:
+        monitor_news._maybe_load_env()
+    mock_load.assert_not_called()
+
+
+def test_maybe_load_env_loads_dotenv_when_missing(monkeypatch):
+    monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
+    monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+    with patch("dotenv.load_dotenv") as mock_load:
+        monitor_news._maybe_load_env()
+    mock_load.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # is_new
 # ---------------------------------------------------------------------------
@@ -43,6 +66,27 @@ def test_is_new_changed_snippet():
     )
 
 
+def test_is_new_ignores_whitespace_changes():
+    last_seen = {"title": "News", "snippet": "Hello  world"}
+    last_seen["hash"] = monitor_news._content_hash(last_seen)
+    item = {"title": " News", "snippet": "Hello\n\nworld "}
+    assert monitor_news.is_new(item, last_seen) is False
+
+
+def test_is_new_compares_stored_hash():
+    item = {"title": "A", "snippet": "x"}
+    last_seen = {"title": "Old", "snippet": "x"}
+    last_seen["hash"] = monitor_news._content_hash(item)
+    assert monitor_news.is_new(item, last_seen) is False
+
+
+def test_is_new_identical_fields_skip_hashing():
+    item = {"title": "A", "snippet": "x"}
+    with patch("monitor_news._content_hash") as mock_hash:
+        assert monitor_news.is_new(item, {**item, "hash": "h"}) is False
+    mock_hash.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # load_last_seen / save_last_seen
 # ---------------------------------------------------------------------------
@@ -67,15 +111,67 @@ def test_load_last_seen_corrupt_file(tmp_path, monkeypatch):
     assert monitor_news.load_last_seen() == {}
 
 
+def test_load_last_seen_reuses_parsed_file_until_it_changes(tmp_path, monkeypatch):
+    f = tmp_path / "last_seen.json"
+    f.write_text('{"title": "T"}', encoding="utf-8")
+    monkeypatch.setattr(monitor_news, "LAST_SEEN_FILE", f)
+
+    first = monitor_news.load_last_seen()
+    first["title"] = "mutated"
+    with patch("monitor_news.json.loads") as mock_loads:
+        assert monitor_news.load_last_seen() == {"title": "T"}
+    mock_loads.assert_not_called()
+
+    f.write_text('{"title": "Changed"}', encoding="utf-8")
+    assert monitor_news.load_last_seen() == {"title": "Changed"}
+
+
 def test_save_and_reload(tmp_path, monkeypatch):
     f = tmp_path / "last_seen.json"
     monkeypatch.setattr(monitor_news, "LAST_SEEN_FILE", f)
     item = {"title": "T", "snippet": "S", "link": "https://example.com"}
     monitor_news.save_last_seen(item)
     assert json.loads(f.read_text(encoding="utf-8")) == item
+    assert f.read_bytes().endswith(b"}\n")
+    assert monitor_news.load_last_seen() == item
+
+
+def test_save_last_seen_keeps_old_file_when_write_fails(tmp_path, monkeypatch):
+    f = tmp_path / "last_seen.json"
+    f.write_text('{"title": "Old"}', encoding="utf-8")
+    monkeypatch.setattr(monitor_news, "LAST_SEEN_FILE", f)
+
+    with (
+        patch("monitor_news.os.fsync", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        monitor_news.save_last_seen({"title": "New"})
+
+    assert monitor_news.load_last_seen() == {"title": "Old"}
+    assert list(tmp_path.iterdir()) == [f]
+
+
+def test_save_and_reload_keeps_non_ascii(tmp_path, monkeypatch):
+    f = tmp_path / "last_seen.json"
+    monkeypatch.setattr(monitor_news, "LAST_SEEN_FILE", f)
+    item = {"title": "Eisklettern", "snippet": "Straße gesperrt", "link": ""}
+    monitor_news.save_last_seen(item)
+    assert "Straße" in f.read_text(encoding="utf-8")
+    assert f.read_bytes().endswith(b"}\n")
     assert monitor_news.load_last_seen() == item
 
 
+def test_last_seen_record_drops_paragraphs_and_old_validators():
+    item = {"title": "T", "snippet": "S", "paragraphs": ["S"], "etag": '"old"'}
+    record = monitor_news._last_seen_record(item, {"last_modified": "now"})
+    assert record == {
+        "title": "T",
+        "snippet": "S",
+        "hash": monitor_news._content_hash(item),
+        "last_modified": "now",
+    }
+
+
 # ---------------------------------------------------------------------------
 # translate_to_english
 # ---------------------------------------------------------------------------
@@ -92,6 +188,36 @@ def test_translate_success():
     assert result == "Hello"
 
 
+def test_translate_skips_text_already_in_english():
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        result = monitor_news.translate_to_english("The glacier is open today")
+    assert result == "The glacier is open today"
+    mock_cls.assert_not_called()
+
+
+def test_translate_still_translates_ascii_german():
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.return_value = "Lift A is open"
+        result = monitor_news.translate_to_english("Lift A ist geoeffnet")
+    assert result == "Lift A is open"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Morgen startet unser Kletterkurs. Unter dem Motto Rock the Ice gibt es "
+        "Kurse fuer Anfaenger und Fortgeschrittene.",
+        "Die Strasse ist gesperrt, bitte Ausruestung to go mitnehmen.",
+        "Eisklettern am Gletscher: Ice and Fire Festival am Wochenende",
+    ],
+)
+def test_translate_still_translates_german_with_english_phrases(text):
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.return_value = "translated"
+        result = monitor_news.translate_to_english(text)
+    assert result == "translated"
+
+
 def test_translate_falls_back_on_translation_not_found():
     from deep_translator.exceptions import TranslationNotFound
 
@@ -126,6 +252,130 @@ def test_translate_falls_back_on_unexpected_error():
     assert result == "Hallo"
 
 
+def test_translate_reuses_translator_instance():
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.side_effect = lambda t: t.upper()
+        monitor_news.translate_to_english("eins")
+        monitor_news.translate_to_english("zwei")
+    mock_cls.assert_called_once_with(source="de", target="en")
+    assert mock_cls.return_value.translate.call_count == 2
+
+
+def test_build_message_reuses_translators_across_calls():
+    """Translators live in long-lived threads, so repeated messages reuse them."""
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.side_effect = lambda t: t.upper()
+        for i in range(10):
+            monitor_news.build_message(
+                {"title": f"Titel {i}", "snippet": f"Inhalt {i}", "link": ""}
+            )
+    assert mock_cls.return_value.translate.call_count == 20
+    # At most one per pool worker plus one for the calling thread.
+    assert mock_cls.call_count <= monitor_news.TRANSLATION_WORKERS + 1
+
+
+def test_translate_repeated_text_is_served_from_memory():
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.return_value = "Hello"
+        assert monitor_news.translate_to_english("Hallo") == "Hello"
+        assert monitor_news.translate_to_english("Hallo") == "Hello"
+    mock_cls.return_value.translate.assert_called_once_with("Hallo")
+    # Nothing is written until the cache is explicitly saved.
+    assert not monitor_news.TRANSLATION_CACHE_FILE.exists()
+
+
+def test_save_translation_cache_writes_once_per_batch():
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.side_effect = lambda t: t.upper()
+        monitor_news.translate_to_english("eins")
+        monitor_news.translate_to_english("zwei")
+
+    with patch(
+        "monitor_news._write_json_atomic", wraps=monitor_news._write_json_atomic
+    ) as mock_write:
+        monitor_news.save_translation_cache()
+        monitor_news.save_translation_cache()
+    mock_write.assert_called_once()
+
+    cache = json.loads(monitor_news.TRANSLATION_CACHE_FILE.read_text(encoding="utf-8"))
+    assert {entry["translated"] for entry in cache.values()} == {"EINS", "ZWEI"}
+
+
+def test_translate_cache_survives_process_restart(monkeypatch):
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.return_value = "Hello"
+        monitor_news.translate_to_english("Hallo")
+    monitor_news.save_translation_cache()
+
+    # A new cron run starts with nothing in memory.
+    monkeypatch.setattr(monitor_news, "_translation_cache", None)
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        assert monitor_news.translate_to_english("Hallo") == "Hello"
+    mock_cls.return_value.translate.assert_not_called()
+
+
+def test_translate_uses_cached_translation():
+    key = monitor_news._translation_cache_key("Hallo")
+    monitor_news.TRANSLATION_CACHE_FILE.write_text(
+        json.dumps({key: {"translated": "Hello", "ts": int(time.time())}}),
+        encoding="utf-8",
+    )
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        result = monitor_news.translate_to_english("Hallo")
+    assert result == "Hello"
+    mock_cls.return_value.translate.assert_not_called()
+
+
+def test_translate_ignores_expired_cache_entry():
+    key = monitor_news._translation_cache_key("Hallo")
+    expired = int(time.time()) - monitor_news.TRANSLATION_CACHE_TTL - 1
+    monitor_news.TRANSLATION_CACHE_FILE.write_text(
+        json.dumps({key: {"translated": "Stale", "ts": expired}}), encoding="utf-8"
+    )
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.return_value = "Hello"
+        result = monitor_news.translate_to_english("Hallo")
+    assert result == "Hello"
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        {"ts": int(time.time())},
+        {"translated": "Stale", "ts": "yesterday"},
+        {"translated": None, "ts": int(time.time())},
+        "Stale",
+    ],
+)
+def test_translate_ignores_malformed_cache_entry(entry):
+    key = monitor_news._translation_cache_key("Hallo")
+    monitor_news.TRANSLATION_CACHE_FILE.write_text(
+        json.dumps({key: entry}), encoding="utf-8"
+    )
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.return_value = "Hello"
+        result = monitor_news.translate_to_english("Hallo")
+    assert result == "Hello"
+
+
+def test_translate_caches_only_successful_translations():
+    from deep_translator.exceptions import RequestError
+
+    with patch("monitor_news.GoogleTranslator") as mock_cls:
+        mock_cls.return_value.translate.side_effect = RequestError()
+        monitor_news.translate_to_english("Hallo")
+        monitor_news.save_translation_cache()
+        assert not monitor_news.TRANSLATION_CACHE_FILE.exists()
+
+        mock_cls.return_value.translate.side_effect = None
+        mock_cls.return_value.translate.return_value = "Hello"
+        monitor_news.translate_to_english("Hallo")
+    monitor_news.save_translation_cache()
+    cache = json.loads(monitor_news.TRANSLATION_CACHE_FILE.read_text(encoding="utf-8"))
+    key = monitor_news._translation_cache_key("Hallo")
+    assert cache[key]["translated"] == "Hello"
+
+
 # ---------------------------------------------------------------------------
 # translate_long_text
 # ---------------------------------------------------------------------------
@@ -157,6 +407,29 @@ def test_translate_long_text_chunks_long_text():
     assert "PARA" in result
 
 
+def test_translate_long_text_keeps_chunk_order():
+    """Chunks translated concurrently are joined back in their original order."""
+    long_text = "\n\n".join(["Para " + str(i) + " " + "x" * 2000 for i in range(6)])
+
+    with patch("monitor_news.translate_to_english", side_effect=lambda t: t.upper()):
+        result = monitor_news.translate_long_text(long_text)
+
+    assert result == long_text.upper()
+
+
+def test_translate_long_text_accepts_paragraph_list():
+    """A paragraph list is packed into chunks without joining and re-splitting."""
+    paragraphs = ["Para " + str(i) + " " + "x" * 2000 for i in range(6)]
+
+    with patch(
+        "monitor_news.translate_to_english", side_effect=lambda t: t.upper()
+    ) as mock_translate:
+        result = monitor_news.translate_long_text(paragraphs)
+
+    assert mock_translate.call_count == 3
+    assert result == "\n\n".join(paragraphs).upper()
+
+
 # ---------------------------------------------------------------------------
 # _split_message_into_chunks
 # ---------------------------------------------------------------------------
@@ -184,6 +457,72 @@ def test_split_message_long_message():
         assert f"Test Title - part {i + 1}" in chunks[i]
 
 
+def test_split_message_keeps_overlong_line_whole():
+    """Chunks end at line breaks; a line longer than the limit stands alone."""
+    msg = "short\n" + "x" * 50 + "\nmore\nlines"
+    chunks = monitor_news._split_message_into_chunks(msg, "T", max_length=20)
+
+    bodies = [chunks[0]] + [c.split("\n\n", 1)[1] for c in chunks[1:]]
+    assert bodies == ["short", "x" * 50, "more\nlines"]
+
+
+# ---------------------------------------------------------------------------
+# send_telegram_message(s)
+# ---------------------------------------------------------------------------
+
+
+def test_send_telegram_message_posts_to_prebuilt_url(monkeypatch):
+    monkeypatch.setattr(monitor_news, "_SEND_URL", "https://api.example/send")
+    monkeypatch.setattr(monitor_news, "_PAYLOAD_BASE", {"chat_id": "42"})
+
+    with patch("monitor_news.SESSION.post") as mock_post:
+        monitor_news.send_telegram_message("hello")
+
+    assert mock_post.call_args.args[0] == "https://api.example/send"
+    assert mock_post.call_args.kwargs["json"] == {"chat_id": "42", "text": "hello"}
+
+
+@pytest.mark.parametrize(
+    ("send_url", "chat_id"), [(None, "42"), ("https://api.example/send", "")]
+)
+def test_send_telegram_message_skips_without_credentials(
+    monkeypatch, send_url, chat_id
+):
+    monkeypatch.setattr(monitor_news, "_SEND_URL", send_url)
+    monkeypatch.setattr(monitor_news, "_PAYLOAD_BASE", {"chat_id": chat_id})
+
+    with patch("monitor_news.SESSION.post") as mock_post:
+        monitor_news.send_telegram_message("hello")
+
+    mock_post.assert_not_called()
+
+
+def test_send_telegram_messages_sends_parts_in_order():
+    """Every chunk is sent, in order, without sleeping between parts."""
+    with (
+        patch("monitor_news.send_telegram_message") as mock_send,
+        patch(
+            "monitor_news._split_message_into_chunks",
+            return_value=["one", "two", "three"],
+        ),
+        patch("time.sleep") as mock_sleep,
+    ):
+        monitor_news.send_telegram_messages({"title": "T"}, "message")
+
+    assert [c.args[0] for c in mock_send.call_args_list] == ["one", "two", "three"]
+    mock_sleep.assert_not_called()
+
+
+def test_send_telegram_messages_escapes_title_for_part_headers():
+    with (
+        patch("monitor_news.send_telegram_message"),
+        patch("monitor_news._split_message_into_chunks", return_value=["x"]) as split,
+    ):
+        monitor_news.send_telegram_messages({"title": "A & B"}, "message")
+
+    split.assert_called_once_with("message", "A &amp; B")
+
+
 # ---------------------------------------------------------------------------
 # build_message
 # ---------------------------------------------------------------------------
@@ -277,10 +616,11 @@ _COLLAPSIBLE_HTML = """
 
 def test_fetch_news_parses_articles():
     mock_resp = MagicMock()
-    mock_resp.text = _SAMPLE_HTML
+    mock_resp.iter_content.return_value = [_SAMPLE_HTML.encode()]
+    mock_resp.encoding = "utf-8"
     mock_resp.raise_for_status.return_value = None
 
-    with patch("monitor_news.requests.get", return_value=mock_resp):
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
         items = monitor_news.fetch_news("https://example.com/news")
 
     assert len(items) == 2
@@ -292,18 +632,61 @@ def test_fetch_news_parses_articles():
 
 def test_fetch_news_parses_collapsible_list():
     mock_resp = MagicMock()
-    mock_resp.text = _COLLAPSIBLE_HTML
+    mock_resp.iter_content.return_value = [_COLLAPSIBLE_HTML.encode()]
+    mock_resp.encoding = "utf-8"
     mock_resp.raise_for_status.return_value = None
 
-    with patch("monitor_news.requests.get", return_value=mock_resp):
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
         items = monitor_news.fetch_news("https://example.com/news")
 
     assert len(items) == 2
     assert items[0]["title"] == "Ice News 22.02.2026"
     assert "Hallo Leute" in items[0]["snippet"]
+    assert items[0]["paragraphs"] == [
+        "Hallo Leute,",
+        "Die Strassensperre wird aufgehoben.",
+    ]
     assert items[1]["title"] == "Ice News 01.11.2025"
 
 
+def test_fetch_news_prefers_news_item_articles():
+    html = """
+    <html><body>
+      <div class="teaser"><h3>Teaser</h3></div>
+      <article><h2>Plain article</h2></article>
+      <article class="news-item"><h2>News article</h2></article>
+    </body></html>
+    """
+    mock_resp = MagicMock()
+    mock_resp.iter_content.return_value = [html.encode()]
+    mock_resp.encoding = "utf-8"
+
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
+        items = monitor_news.fetch_news("https://example.com/news")
+
+    assert [item["title"] for item in items] == ["News article"]
+
+
+def test_fetch_news_finds_title_and_teaser_by_class():
+    html = """
+    <html><body>
+      <article>
+        <div class="News-Title">Classed title</div>
+        <div class="teaserText">Classed teaser</div>
+      </article>
+    </body></html>
+    """
+    mock_resp = MagicMock()
+    mock_resp.iter_content.return_value = [html.encode()]
+    mock_resp.encoding = "utf-8"
+
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
+        items = monitor_news.fetch_news("https://example.com/news")
+
+    assert items[0]["title"] == "Classed title"
+    assert items[0]["snippet"] == "Classed teaser"
+
+
 def test_fetch_news_preserves_full_title_with_multiple_dates():
     """Test that full accordion header text is preserved, including complex titles."""
     html = """
@@ -319,10 +702,11 @@ def test_fetch_news_preserves_full_title_with_multiple_dates():
     </body></html>
     """
     mock_resp = MagicMock()
-    mock_resp.text = html
+    mock_resp.iter_content.return_value = [html.encode()]
+    mock_resp.encoding = "utf-8"
     mock_resp.raise_for_status.return_value = None
 
-    with patch("monitor_news.requests.get", return_value=mock_resp):
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
         items = monitor_news.fetch_news("https://example.com/news")
 
     assert len(items) == 1
@@ -331,17 +715,120 @@ def test_fetch_news_preserves_full_title_with_multiple_dates():
     assert items[0]["snippet"] == "News content here."
 
 
+def test_fetch_news_prefers_list_after_ice_news_heading():
+    html = """
+    <html><body>
+      <h2>Opening hours</h2>
+      <ul class="collapsible">
+        <li><div class="collapsible-header">Mon-Fri</div></li>
+      </ul>
+      <h2>Ice News 2025/26</h2>
+      <ul class="collapsible">
+        <li><div class="collapsible-header">Ice News 22.02.2026</div></li>
+      </ul>
+    </body></html>
+    """
+    mock_resp = MagicMock()
+    mock_resp.iter_content.return_value = [html.encode()]
+    mock_resp.encoding = "utf-8"
+
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
+        items = monitor_news.fetch_news("https://example.com/news")
+
+    assert [item["title"] for item in items] == ["Ice News 22.02.2026"]
+
+
+@pytest.mark.parametrize("heading", ["Ice news 2025", "ICE News"])
+def test_fetch_news_matches_ice_news_heading_in_any_case(heading):
+    html = f"""
+    <html><body>
+      <h2>Opening hours</h2>
+      <ul class="collapsible">
+        <li><div class="collapsible-header">Mon-Fri</div></li>
+      </ul>
+      <h2>{heading}</h2>
+      <ul class="collapsible">
+        <li><div class="collapsible-header">Ice News 22.02.2026</div></li>
+      </ul>
+      <p>Footer</p>
+    </body></html>
+    """
+    head, tail = html.split("<p>Footer")
+    chunks = iter([head.encode(), b"<p>Footer" + tail.encode()])
+    mock_resp = MagicMock()
+    mock_resp.iter_content.return_value = chunks
+    mock_resp.encoding = "utf-8"
+
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
+        items = monitor_news.fetch_news("https://example.com/news")
+
+    assert [item["title"] for item in items] == ["Ice News 22.02.2026"]
+    assert next(chunks).startswith(b"<p>Footer")
+
+
+def test_fetch_news_stops_download_after_ice_news_list():
+    """Bytes after the "Ice News" accordion are never read from the socket."""
+    head, tail = _COLLAPSIBLE_HTML.split("</ul>")
+    chunks = iter([head.encode(), b"</ul>\n<p>", b"Footer</p>" + tail.encode()])
+    mock_resp = MagicMock()
+    mock_resp.iter_content.return_value = chunks
+    mock_resp.encoding = "utf-8"
+
+    with patch("monitor_news.SESSION.get", return_value=mock_resp) as mock_get:
+        items = monitor_news.fetch_news("https://example.com/news")
+
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert next(chunks).startswith(b"Footer")
+    mock_resp.close.assert_called_once()
+    assert [item["title"] for item in items] == [
+        "Ice News 22.02.2026",
+        "Ice News 01.11.2025",
+    ]
+
+
 def test_fetch_news_empty_page():
     mock_resp = MagicMock()
-    mock_resp.text = "<html><body></body></html>"
+    mock_resp.iter_content.return_value = ["<html><body></body></html>".encode()]
+    mock_resp.encoding = "utf-8"
     mock_resp.raise_for_status.return_value = None
 
-    with patch("monitor_news.requests.get", return_value=mock_resp):
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
         items = monitor_news.fetch_news("https://example.com/news")
 
     assert items == []
 
 
+def test_fetch_news_sends_validators_and_handles_not_modified():
+    mock_resp = MagicMock()
+    mock_resp.status_code = 304
+    validators = {"etag": '"abc"', "last_modified": "Sun, 22 Feb 2026 10:00:00 GMT"}
+
+    with patch("monitor_news.SESSION.get", return_value=mock_resp) as mock_get:
+        items = monitor_news.fetch_news("https://example.com/news", validators)
+
+    assert items is None
+    assert mock_get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Sun, 22 Feb 2026 10:00:00 GMT",
+    }
+    mock_resp.raise_for_status.assert_not_called()
+
+
+def test_fetch_news_updates_validators():
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.iter_content.return_value = [_SAMPLE_HTML.encode()]
+    mock_resp.encoding = "utf-8"
+    mock_resp.headers = {"ETag": '"new"'}
+    validators = {"etag": '"old"', "last_modified": "Sun, 22 Feb 2026 10:00:00 GMT"}
+
+    with patch("monitor_news.SESSION.get", return_value=mock_resp):
+        items = monitor_news.fetch_news("https://example.com/news", validators)
+
+    assert len(items) == 2
+    assert validators == {"etag": '"new"'}
+
+
 # ---------------------------------------------------------------------------
 # main (integration-style with all I/O mocked)
 # ---------------------------------------------------------------------------
@@ -385,20 +872,65 @@ def test_main_new_item_sends_and_saves(tmp_path, monkeypatch, capsys):
         patch("monitor_news.translate_to_english", side_effect=lambda t: t),
         patch("monitor_news.translate_long_text", side_effect=lambda t: t),
         patch("monitor_news.load_last_seen", return_value=last_seen),
+        patch("monitor_news.save_translation_cache") as mock_save_cache,
         patch("monitor_news.send_telegram_messages") as mock_telegram,
         patch("monitor_news.save_last_seen") as mock_save,
     ):
         monitor_news.main(preview=True, telegram=True)
 
     # Should send telegram and save
+    mock_save_cache.assert_called_once_with()
     mock_telegram.assert_called_once()
-    mock_save.assert_called_once_with(item)
+    mock_save.assert_called_once_with(
+        {**item, "hash": monitor_news._content_hash(item)}
+    )
 
     # Should show preview
     captured = capsys.readouterr()
     assert "New News" in captured.out
 
 
+def test_main_not_modified_skips_notification(tmp_path, monkeypatch):
+    """A 304 response ends the run before any parsing or notification."""
+    monkeypatch.setattr(monitor_news, "LAST_SEEN_FILE", tmp_path / "last_seen.json")
+    last_seen = {"title": "T", "snippet": "S", "etag": '"abc"'}
+
+    with (
+        patch("monitor_news.fetch_news", return_value=None) as mock_fetch,
+        patch("monitor_news.load_last_seen", return_value=last_seen),
+        patch("monitor_news.send_telegram_messages") as mock_telegram,
+        patch("monitor_news.save_last_seen") as mock_save,
+    ):
+        monitor_news.main(preview=True, telegram=True)
+
+    assert mock_fetch.call_args.kwargs["validators"] == {"etag": '"abc"'}
+    mock_telegram.assert_not_called()
+    mock_save.assert_not_called()
+
+
+def test_main_refreshes_validators_when_item_unchanged(tmp_path, monkeypatch):
+    """New validators are stored even when the latest item is unchanged."""
+    monkeypatch.setattr(monitor_news, "LAST_SEEN_FILE", tmp_path / "last_seen.json")
+    item = {"title": "Same News", "snippet": "Same content", "link": "https://x.com"}
+
+    def fake_fetch(validators):
+        validators["etag"] = '"new"'
+        return [item]
+
+    with (
+        patch("monitor_news.fetch_news", side_effect=fake_fetch),
+        patch("monitor_news.load_last_seen", return_value={**item, "etag": '"old"'}),
+        patch("monitor_news.send_telegram_messages") as mock_telegram,
+        patch("monitor_news.save_last_seen") as mock_save,
+    ):
+        monitor_news.main(preview=False, telegram=True)
+
+    mock_telegram.assert_not_called()
+    mock_save.assert_called_once_with(
+        {**item, "hash": monitor_news._content_hash(item), "etag": '"new"'}
+    )
+
+
 def test_main_already_pulled_skips_notification(tmp_path, monkeypatch, capsys):
     """Test that an already-seen item does not trigger notification."""
     monkeypatch.setattr(monitor_news, "LAST_SEEN_FILE", tmp_path / "last_seen.json")
@@ -407,11 +939,15 @@ def test_main_already_pulled_skips_notification(tmp_path, monkeypatch, capsys):
     with (
         patch("monitor_news.fetch_news", return_value=[item]),
         patch("monitor_news.load_last_seen", return_value=item),
+        patch("monitor_news.translate_to_english") as mock_translate,
+        patch("monitor_news.translate_long_text") as mock_translate_long,
         patch("monitor_news.send_telegram_messages") as mock_telegram,
         patch("monitor_news.save_last_seen") as mock_save,
     ):
         monitor_news.main(preview=True, telegram=True)
 
-    # Should NOT send telegram or save
+    # Should NOT translate, send telegram or save
+    mock_translate.assert_not_called()
+    mock_translate_long.assert_not_called()
     mock_telegram.assert_not_called()
     mock_save.assert_not_called()